@@ -6,8 +6,51 @@ from datetime import datetime
 from typing import Optional, List, Dict
 from enum import Enum
 
+# Decimal constants parsed once at import instead of per call.
+_D_ZERO = Decimal('0')
+_D_ONE = Decimal('1')
+_D_HALF = Decimal('0.5')
 
-@dataclass
+# Quantization targets, parsed once instead of per quantize call.
+_Q1 = Decimal('0.1')
+_Q2 = Decimal('0.01')
+
+
+def _q2(value: Decimal) -> Decimal:
+    """Quantize to cents, skipping the allocation when already at target precision."""
+    return value if value.as_tuple().exponent >= -2 else value.quantize(_Q2)
+
+
+def _growth_rate(current: Optional['Decimal'], previous: Optional['Decimal']) -> Optional['Decimal']:
+    """Period-over-period growth in percent, or None when undefined.
+
+    Kept as a free function so the numeric kernel is a single seam that a
+    compiled accelerator could replace wholesale.
+    """
+    if current is None or previous is None or previous == 0:
+        return None
+    # Use absolute value of denominator for meaningful percentage when base is negative
+    return (((current - previous) / abs(previous)) * 100).quantize(_Q1)
+
+
+def _qm(value: Decimal) -> Decimal:
+    """Normalize a monetary value to millions and quantize to cents."""
+    # Convert to millions if the absolute value is large (assuming input is in actual dollars)
+    if abs(value) > 1_000_000:
+        value = value / 1_000_000
+    return _q2(value)
+
+
+# Display labels for quote types, looked up in one hash probe instead of a
+# branch cascade of string compares.
+_QUOTE_TYPE_LABELS = {
+    "MUTUALFUND": "Mutual Fund",
+    "CRYPTOCURRENCY": "Cryptocurrency",
+    "CURRENCY": "Currency",
+}
+
+
+@dataclass(slots=True)
 class GrowthMetrics:
     """Stock growth performance over different periods."""
     
@@ -19,24 +62,35 @@ class GrowthMetrics:
     
     def __post_init__(self):
         """Validate and quantize growth percentages."""
-        for field_name in ["one_year", "two_years", "three_years", "five_years", "ten_years"]:
-            value = getattr(self, field_name)
-            if value is not None:
-                setattr(self, field_name, value.quantize(Decimal('0.01')))
+        # Unrolled per field to avoid getattr/setattr reflection on every construction.
+        if self.one_year is not None:
+            self.one_year = _q2(self.one_year)
+        if self.two_years is not None:
+            self.two_years = _q2(self.two_years)
+        if self.three_years is not None:
+            self.three_years = _q2(self.three_years)
+        if self.five_years is not None:
+            self.five_years = _q2(self.five_years)
+        if self.ten_years is not None:
+            self.ten_years = _q2(self.ten_years)
     
+    # Maps period strings to attribute names once, so get_growth avoids
+    # rebuilding a dict (and reading all five fields) per call.
+    _PERIOD_ATTRS = {
+        "1y": "one_year",
+        "2y": "two_years",
+        "3y": "three_years",
+        "5y": "five_years",
+        "10y": "ten_years"
+    }
+
     def get_growth(self, period: str) -> Optional[Decimal]:
         """Get growth for a specific period."""
-        period_map = {
-            "1y": self.one_year,
-            "2y": self.two_years,
-            "3y": self.three_years,
-            "5y": self.five_years,
-            "10y": self.ten_years
-        }
-        return period_map.get(period.lower())
+        attr = self._PERIOD_ATTRS.get(period.lower())
+        return getattr(self, attr) if attr else None
 
 
-@dataclass
+@dataclass(slots=True)
 class FinancialPeriod:
     """Single period financial data."""
     date: datetime
@@ -56,18 +110,31 @@ class FinancialPeriod:
     
     def __post_init__(self):
         """Validate and quantize financial values."""
-        # Convert to millions and quantize to 2 decimal places
-        for field_name in ["total_revenue", "net_income", "total_assets", "total_liabilities", "total_equity",
-                          "operating_cash_flow", "investing_cash_flow", "financing_cash_flow", "changes_in_cash", "free_cash_flow"]:
-            value = getattr(self, field_name)
-            if value is not None:
-                # Convert to millions if the absolute value is large (assuming input is in actual dollars)
-                if abs(value) > 1_000_000:
-                    value = value / 1_000_000
-                setattr(self, field_name, value.quantize(Decimal('0.01')))
-
-
-@dataclass
+        # Convert to millions and quantize to 2 decimal places.
+        # Unrolled per field to avoid getattr/setattr reflection on every construction.
+        if self.total_revenue is not None:
+            self.total_revenue = _qm(self.total_revenue)
+        if self.net_income is not None:
+            self.net_income = _qm(self.net_income)
+        if self.total_assets is not None:
+            self.total_assets = _qm(self.total_assets)
+        if self.total_liabilities is not None:
+            self.total_liabilities = _qm(self.total_liabilities)
+        if self.total_equity is not None:
+            self.total_equity = _qm(self.total_equity)
+        if self.operating_cash_flow is not None:
+            self.operating_cash_flow = _qm(self.operating_cash_flow)
+        if self.investing_cash_flow is not None:
+            self.investing_cash_flow = _qm(self.investing_cash_flow)
+        if self.financing_cash_flow is not None:
+            self.financing_cash_flow = _qm(self.financing_cash_flow)
+        if self.changes_in_cash is not None:
+            self.changes_in_cash = _qm(self.changes_in_cash)
+        if self.free_cash_flow is not None:
+            self.free_cash_flow = _qm(self.free_cash_flow)
+
+
+@dataclass(slots=True)
 class FinancialHistory:
     """Historical financial data with growth calculations."""
     annual_periods: List[FinancialPeriod] = field(default_factory=list)
@@ -116,24 +183,23 @@ class FinancialHistory:
         """Calculate period-over-period growth rates with proper handling for negative base values."""
         if len(periods) < 2:
             return []
-        
-        growth_rates = []
-        
-        for i in range(len(periods) - 1):
-            current = getattr(periods[i], metric)      # More recent (index 0 is most recent)
-            previous = getattr(periods[i + 1], metric) # Older period
-            
-            if current is not None and previous is not None and previous != 0:
-                # Use absolute value of denominator for meaningful percentage when base is negative
-                growth = ((current - previous) / abs(previous)) * 100
-                growth_rates.append(growth.quantize(Decimal('0.1')))
-            else:
-                growth_rates.append(None)
-        
+
+        # Extract the metric column once so the pairwise loop below works on a
+        # plain list instead of repeated per-period attribute reflection.
+        values = [getattr(period, metric) for period in periods]
+
+        # Preallocated: the result length is known, so skip append/resize churn.
+        n = len(values) - 1
+        growth_rates: List[Optional[Decimal]] = [None] * n
+
+        for i in range(n):
+            # Index 0 is most recent, so values[i] is newer than values[i + 1]
+            growth_rates[i] = _growth_rate(values[i], values[i + 1])
+
         return growth_rates
 
 
-@dataclass
+@dataclass(slots=True)
 class PriceRange:
     """Price range information."""
     
@@ -150,18 +216,18 @@ class PriceRange:
             raise ValueError("Day low must be less than or equal to day high")
         
         # Quantize to 2 decimal places
-        self.week_52_low = self.week_52_low.quantize(Decimal('0.01'))
-        self.week_52_high = self.week_52_high.quantize(Decimal('0.01'))
-        self.day_low = self.day_low.quantize(Decimal('0.01'))
-        self.day_high = self.day_high.quantize(Decimal('0.01'))
+        self.week_52_low = _q2(self.week_52_low)
+        self.week_52_high = _q2(self.week_52_high)
+        self.day_low = _q2(self.day_low)
+        self.day_high = _q2(self.day_high)
     
     def calculate_position_in_range(self, current_price: Decimal) -> Decimal:
         """Calculate position in 52-week range (0.0 to 1.0)."""
         if self.week_52_high <= self.week_52_low:
-            return Decimal('0.5')
+            return _D_HALF
         
         position = (current_price - self.week_52_low) / (self.week_52_high - self.week_52_low)
-        return max(Decimal('0'), min(Decimal('1'), position))
+        return max(_D_ZERO, min(_D_ONE, position))
     
     @property
     def range_width(self) -> Decimal:
@@ -169,7 +235,7 @@ class PriceRange:
         return self.week_52_high - self.week_52_low
 
 
-@dataclass
+@dataclass(slots=True)
 class StockInfo:
     """Pure stock information domain model."""
     
@@ -222,15 +288,15 @@ class StockInfo:
             raise ValueError("Symbol cannot be empty")
         
         # Ensure proper decimal precision
-        self.current_price = self.current_price.quantize(Decimal('0.01'))
-        self.change = self.change.quantize(Decimal('0.01'))
-        self.change_percent = self.change_percent.quantize(Decimal('0.01'))
-        
+        self.current_price = _q2(self.current_price)
+        self.change = _q2(self.change)
+        self.change_percent = _q2(self.change_percent)
+
         # Quantize dividend fields if present
         if self.dividend_yield is not None:
-            self.dividend_yield = self.dividend_yield.quantize(Decimal('0.01'))
+            self.dividend_yield = _q2(self.dividend_yield)
         if self.dividend_rate is not None:
-            self.dividend_rate = self.dividend_rate.quantize(Decimal('0.01'))
+            self.dividend_rate = _q2(self.dividend_rate)
     
     @property
     def is_profitable(self) -> Optional[bool]:
@@ -250,22 +316,27 @@ class StockInfo:
     @property
     def pays_dividend(self) -> bool:
         """Check if the stock pays dividends."""
-        return (self.dividend_rate is not None and self.dividend_rate > 0) or \
-               (self.dividend_yield is not None and self.dividend_yield > 0)
+        # Locals avoid re-reading each attribute for the second comparison.
+        rate = self.dividend_rate
+        if rate is not None and rate > 0:
+            return True
+        yield_ = self.dividend_yield
+        return yield_ is not None and yield_ > 0
     
     @property
     def market_cap_category(self) -> str:
         """Categorize market cap size."""
-        if not self.market_cap:
+        mc = self.market_cap
+        if mc is None:
             return "unknown"
-        
-        if self.market_cap >= 200e9:
+
+        if mc >= 200e9:
             return "mega_cap"
-        elif self.market_cap >= 10e9:
+        elif mc >= 10e9:
             return "large_cap"
-        elif self.market_cap >= 2e9:
+        elif mc >= 2e9:
             return "mid_cap"
-        elif self.market_cap >= 300e6:
+        elif mc >= 300e6:
             return "small_cap"
         else:
             return "micro_cap"
@@ -274,16 +345,9 @@ class StockInfo:
         """Get appropriate classification for display."""
         if self.quote_type == 'ETF' and self.category:
             return self.category  # e.g., "Large Blend", "Small Growth"
-        elif self.quote_type == 'MUTUALFUND':
-            return "Mutual Fund"
-        elif self.quote_type == 'CRYPTOCURRENCY':
-            return "Cryptocurrency"
-        elif self.quote_type == 'CURRENCY':
-            return "Currency"
-        elif self.sector:
-            return self.sector  # For regular stocks
-        else:
-            return "Unknown"
+
+        label = _QUOTE_TYPE_LABELS.get(self.quote_type)
+        return label or self.sector or "Unknown"
 
 
 class MarketCapSize(Enum):
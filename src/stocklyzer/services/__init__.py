@@ -1,8 +1,24 @@
 """Services package."""
 
 from .interfaces import StockService
-from .stock_service import YFinanceStockService
 from .mock_service import MockStockService
 from .factory import ServiceFactory
 
-__all__ = ['StockService', 'YFinanceStockService', 'MockStockService', 'ServiceFactory']
\ No newline at end of file
+__all__ = ['StockService', 'YFinanceStockService', 'MockStockService', 'ServiceFactory', 'DiscountedCashFlow']
+
+# Names that pull in yfinance (and transitively pandas/numpy) are resolved
+# on first access (PEP 562) so `import stocklyzer.services` stays cheap.
+_LAZY_IMPORTS = {
+    'YFinanceStockService': 'stock_service',
+    'DiscountedCashFlow': 'dcf',
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+    value = getattr(import_module(f'.{module_name}', __name__), name)
+    globals()[name] = value
+    return value
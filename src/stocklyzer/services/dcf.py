@@ -0,0 +1,268 @@
+"""Discounted cash flow valuation service."""
+
+import yfinance as yf
+import logging
+import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from decimal import Decimal, InvalidOperation
+from functools import lru_cache
+from typing import Optional
+
+from ..utils.ticker_bundle import TickerBundle
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=4)
+def _cached_treasury_rate(day: date) -> float:
+    """10-year treasury yield as a decimal fraction, cached per calendar day.
+
+    Keyed by date so a long-running process refreshes daily while a batch
+    over N tickers performs exactly one ^TNX fetch. An empty frame raises
+    instead of returning None: lru_cache does not memoize exceptions, so a
+    transient Yahoo failure is retried on the next call rather than pinned
+    for the rest of the day.
+    """
+    tnx_hist = yf.Ticker("^TNX").history(period="1d")
+    if tnx_hist.empty:
+        raise ValueError("no ^TNX data returned")
+    # Direct ndarray read, skipping the iloc Series construction
+    return float(tnx_hist['Close'].to_numpy()[-1]) / 100
+
+
+def _treasury_rate_today() -> Optional[float]:
+    """Today's cached treasury rate, or None when the fetch failed."""
+    try:
+        return _cached_treasury_rate(date.today())
+    except Exception:
+        return None
+
+
+def clear_treasury_cache() -> None:
+    """Reset the cached treasury rate (primarily for tests)."""
+    _cached_treasury_rate.cache_clear()
+
+def _wacc_kernel(cost_of_debt: float, cost_of_equity: float,
+                 total_debt: float, market_cap: float) -> float:
+    """Final WACC aggregation on plain floats.
+
+    Fixed float-only signature, no Python objects inside: jit-compilable
+    as-is should a compiled backend ever be worth the dependency.
+    """
+    total_value = total_debt + market_cap
+    return (cost_of_debt * (total_debt / total_value)
+            + cost_of_equity * (market_cap / total_value))
+
+
+def _coe_kernel(treasury: float, beta: float, required_return: float) -> float:
+    """CAPM cost of equity on plain floats."""
+    return treasury + beta * (required_return - treasury)
+
+
+# Statement row labels used by the cost-of-capital calculation.
+FIN_INTEREST_EXP = 'Interest Expense'
+CF_INTEREST_PAID = 'Interest Paid Supplemental Data'
+BS_LONG_TERM_DEBT = 'Long Term Debt'
+BS_CURRENT_DEBT = 'Current Debt'
+BS_TOTAL_DEBT = 'Total Debt'
+FIN_TAX_PROVISION = 'Tax Provision'
+FIN_PRETAX_INCOME = 'Pretax Income'
+
+
+class DiscountedCashFlow:
+    """Cost-of-capital calculations for DCF valuation of a single ticker.
+
+    WACC is computed as E/V * Re + D/V * Rd * (1 - Tc), with the cost of
+    equity from CAPM against the 10-year treasury and the cost of debt from
+    the most recent year with complete statement data.
+    """
+
+    # batch() builds one instance per ticker; slots keep them small and
+    # pin the attribute set the memoized properties rely on.
+    __slots__ = ('ticker', 'perpetual_growth_rate', 'required_return',
+                 '_info', '_bs', '_fin', '_cf')
+
+    def __init__(self, ticker, perpetual_growth_rate: float = 0.025,
+                 required_return: float = 0.08,
+                 bundle: Optional[TickerBundle] = None):
+        """Initialize for a ticker symbol or an existing yf.Ticker.
+
+        When a prefetched TickerBundle is supplied, its fundamentals seed
+        the memo slots so no fetch happens here at all.
+        """
+        self.ticker = ticker if isinstance(ticker, yf.Ticker) else yf.Ticker(ticker)
+        self.perpetual_growth_rate = perpetual_growth_rate
+        self.required_return = required_return
+        # Every yfinance attribute touch re-triggers network and parse work,
+        # so each fundamental is fetched at most once per instance.
+        self._info = bundle.info if bundle is not None else None
+        self._bs = bundle.balance_sheet if bundle is not None else None
+        self._fin = bundle.financials if bundle is not None else None
+        self._cf = bundle.cash_flow if bundle is not None else None
+
+    @property
+    def info(self) -> dict:
+        """Ticker .info dict, fetched once and memoized."""
+        if self._info is None:
+            self._info = self.ticker.info
+        return self._info
+
+    @property
+    def balance_sheet(self) -> pd.DataFrame:
+        """Annual balance sheet, fetched once and memoized."""
+        if self._bs is None:
+            self._bs = self.ticker.balance_sheet
+        return self._bs
+
+    @property
+    def financials(self) -> pd.DataFrame:
+        """Annual income statement, fetched once and memoized."""
+        if self._fin is None:
+            self._fin = self.ticker.financials
+        return self._fin
+
+    @property
+    def cash_flow(self) -> pd.DataFrame:
+        """Annual cash flow statement, fetched once and memoized."""
+        if self._cf is None:
+            self._cf = self.ticker.cash_flow
+        return self._cf
+
+    @classmethod
+    def batch(cls, symbols: list, max_workers: int = 8) -> dict:
+        """Compute WACC for many symbols concurrently.
+
+        All symbols share one yf.Tickers session and the day-cached treasury
+        rate, so N tickers cost roughly one round of parallel fetches.
+        Symbols whose calculation fails map to None.
+        """
+        normalized = [symbol.upper() for symbol in symbols]
+        tickers = yf.Tickers(" ".join(normalized))
+        # Warm the treasury cache once up front so the workers all reuse it
+        _treasury_rate_today()
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                symbol: executor.submit(
+                    lambda symbol=symbol: cls(tickers.tickers[symbol])
+                    .calculate_weighted_average_cost_of_capital())
+                for symbol in normalized
+            }
+            return {symbol: future.result() for symbol, future in futures.items()}
+
+    def calculate_weighted_average_cost_of_capital(self) -> Optional[Decimal]:
+        """Calculate WACC for the ticker, or None if inputs are missing.
+
+        Missing data is the common failure mode here, so it is handled by
+        explicit guards rather than by letting KeyErrors propagate to a
+        catch-all; exception handling stays narrow around the fetches
+        (genuinely exceptional) and the final arithmetic.
+        """
+        # The four fundamental fetches and the treasury quote are
+        # independent HTTP calls; issue them together so wall time is the
+        # slowest round trip instead of the sum of all five.
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            info_future = executor.submit(lambda: self.info)
+            bs_future = executor.submit(lambda: self.balance_sheet)
+            fin_future = executor.submit(lambda: self.financials)
+            cf_future = executor.submit(lambda: self.cash_flow)
+            treasury_future = executor.submit(self._get_treasury_rate)
+        try:
+            info = info_future.result()
+            balance_sheet = bs_future.result()
+            financials = fin_future.result()
+            cash_flow = cf_future.result()
+            treasury_10y = treasury_future.result()
+        except Exception as e:
+            logger.warning("Failed to fetch data for %s: %s", self.ticker.ticker, e)
+            return None
+
+        market_cap = info.get('marketCap') if info else None
+        if not market_cap:
+            logger.warning("No market cap for %s", self.ticker.ticker)
+            return None
+        if balance_sheet is None or balance_sheet.empty:
+            return None
+
+        # Total debt per year is computed once and shared between the
+        # WACC weights (newest year) and the cost-of-debt scan
+        total_debt_by_year = self._total_debt_by_year(balance_sheet)
+        cost_of_debt = self._get_cost_of_debt(financials, total_debt_by_year, cash_flow)
+        total_debt = None
+        newest = total_debt_by_year.get(balance_sheet.columns[0])
+        if newest is not None and newest == newest:
+            total_debt = float(newest)
+        cost_of_equity = self._get_cost_of_equity(info, treasury_10y)
+
+        if cost_of_debt is None or total_debt is None or cost_of_equity is None:
+            return None
+
+        # All intermediate arithmetic runs in float; the result is
+        # wrapped in Decimal exactly once at the boundary
+        try:
+            wacc = _wacc_kernel(cost_of_debt, cost_of_equity, total_debt, float(market_cap))
+            return Decimal(repr(wacc))
+        except (ZeroDivisionError, InvalidOperation):
+            return None
+
+    @staticmethod
+    def _total_debt_by_year(balance_sheet: pd.DataFrame) -> pd.Series:
+        """Per-year total debt: long-term (+ current when present), else total."""
+        empty = pd.Series(dtype=float)
+        index = balance_sheet.index
+        long_term = balance_sheet.loc[BS_LONG_TERM_DEBT] if BS_LONG_TERM_DEBT in index else empty
+        current = balance_sheet.loc[BS_CURRENT_DEBT] if BS_CURRENT_DEBT in index else empty
+        total = balance_sheet.loc[BS_TOTAL_DEBT] if BS_TOTAL_DEBT in index else empty
+        if long_term.empty:
+            return total
+        combined = long_term + current.reindex(long_term.index).fillna(0.0)
+        return combined.combine_first(total)
+
+    def _get_cost_of_debt(self, financials: pd.DataFrame,
+                          total_debt_by_year: pd.Series,
+                          cash_flow: pd.DataFrame) -> Optional[float]:
+        """After-tax cost of debt from the newest year with complete data.
+
+        The per-year inputs are built as aligned Series in a few vectorized
+        operations; picking the newest complete year is then a single dropna
+        instead of a Python loop doing per-year scalar indexing.
+        """
+        empty = pd.Series(dtype=float)
+
+        # Membership is resolved once per frame; without any interest-expense
+        # source there is nothing to compute, so skip the alignment work.
+        fin_index = financials.index
+        has_fin_interest = FIN_INTEREST_EXP in fin_index
+        has_cf_interest = CF_INTEREST_PAID in cash_flow.index
+        if not (has_fin_interest or has_cf_interest):
+            return None
+
+        interest = financials.loc[FIN_INTEREST_EXP] if has_fin_interest else empty
+        if has_cf_interest:
+            interest = interest.combine_first(cash_flow.loc[CF_INTEREST_PAID])
+
+        if FIN_TAX_PROVISION in fin_index and FIN_PRETAX_INCOME in fin_index:
+            pretax = financials.loc[FIN_PRETAX_INCOME]
+            tax = (financials.loc[FIN_TAX_PROVISION] / pretax).where(pretax != 0)
+        else:
+            tax = empty
+
+        valid = pd.concat({'ie': interest, 'td': total_debt_by_year, 'tax': tax}, axis=1)
+        valid = valid.reindex(financials.columns).dropna()
+        valid = valid[valid['td'] != 0]
+        if valid.empty:
+            return None
+        row = valid.iloc[0]
+        return float(row['ie']) / float(row['td']) * (1.0 - float(row['tax']))
+
+    def _get_treasury_rate(self) -> Optional[float]:
+        """Current 10-year treasury yield as a decimal fraction."""
+        return _treasury_rate_today()
+
+    def _get_cost_of_equity(self, info: dict,
+                            treasury_10y: Optional[float]) -> Optional[float]:
+        """Cost of equity via CAPM against the 10-year treasury."""
+        beta = info.get('beta')
+        if beta is None or treasury_10y is None:
+            return None
+        return _coe_kernel(treasury_10y, float(beta), self.required_return)
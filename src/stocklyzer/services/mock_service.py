@@ -1,15 +1,22 @@
 """Mock service for testing."""
 
+import re
 from decimal import Decimal
 from datetime import datetime
 from typing import Optional, Dict
 
-from .interfaces import StockService
 from ..domain.models import StockInfo, GrowthMetrics, PriceRange, FinancialHistory, FinancialPeriod
 
+# Precompiled so validation is a single regex scan instead of separate
+# len/isalpha checks per call.
+_SYMBOL_RE = re.compile(r'[A-Za-z]{1,5}\Z')
 
-class MockStockService(StockService):
-    """Mock stock service for testing."""
+
+class MockStockService:
+    """Mock stock service for testing.
+
+    Satisfies the StockService protocol structurally.
+    """
     
     def __init__(self, symbol: str, mock_data: Optional[Dict[str, StockInfo]] = None):
         """Initialize with symbol and mock data."""
@@ -22,7 +29,7 @@ class MockStockService(StockService):
     
     def validate_symbol(self, symbol: str) -> bool:
         """Simple mock validation."""
-        return isinstance(symbol, str) and 1 <= len(symbol) <= 5 and symbol.isalpha()
+        return isinstance(symbol, str) and _SYMBOL_RE.match(symbol) is not None
     
     def is_available(self) -> bool:
         """Mock service is always available."""
@@ -1,13 +1,17 @@
 """YFinance-based stock service implementation."""
 
+import asyncio
 import yfinance as yf
 import pandas as pd
 import logging
-from decimal import Decimal
-from datetime import datetime
+import time
+import requests
+from decimal import Decimal, ROUND_HALF_EVEN
+from datetime import datetime, timezone
+from requests.adapters import HTTPAdapter
 from typing import Optional
+from urllib3.util.retry import Retry
 
-from .interfaces import StockService
 from ..domain.models import StockInfo, GrowthMetrics, PriceRange, FinancialHistory, FinancialPeriod
 from ..utils.calculations import GrowthCalculator
 from ..utils.validators import SymbolValidator
@@ -15,25 +19,213 @@ from ..utils.exceptions import StockDataError, ValidationError
 
 logger = logging.getLogger(__name__)
 
+_Q4 = Decimal('0.0001')
+
+
+def _to_money(value: float) -> Decimal:
+    """Convert a float to a 4-decimal Decimal without the str() round-trip."""
+    return Decimal(value).quantize(_Q4, rounding=ROUND_HALF_EVEN)
+
+
+def _dec(value) -> Optional[Decimal]:
+    """Convert a raw statement scalar to Decimal, mapping None/NaN to None.
+
+    The NaN self-compare is much cheaper than pd.isna for scalars, and
+    Decimal(float) skips the str() round-trip.
+    """
+    if value is None or value != value:
+        return None
+    return Decimal(float(value)).quantize(_Q4, rounding=ROUND_HALF_EVEN)
+
+
+def _int(value) -> Optional[int]:
+    """Convert a raw statement scalar to int, mapping None/NaN to None."""
+    return None if value is None or value != value else int(value)
+
+
+def _build_session() -> requests.Session:
+    """Build a pooled session with keep-alive and retries for all Yahoo calls."""
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=50,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504]
+        )
+    ))
+    session.headers['User-Agent'] = (
+        'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 '
+        '(KHTML, like Gecko) Chrome/120.0 Safari/537.36'
+    )
+    return session
+
+
+# Shared across all service instances so repeated Ticker calls reuse warm
+# TCP/TLS connections instead of re-handshaking per request.
+_SESSION = _build_session()
+
+# Raw fetch results cached per symbol so repeat queries within a session skip
+# the Yahoo round trips. 15 minutes matches intraday quote cadence.
+_RAW_CACHE: dict[str, tuple[float, dict]] = {}
+_RAW_CACHE_TTL = 900.0
+
+# Guards concurrent fetches for the same symbol: the first coroutine performs
+# the fetch while later ones await its future instead of duplicating the calls.
+_INFLIGHT: dict[str, asyncio.Future] = {}
+_INFLIGHT_LOCK = asyncio.Lock()
+
+# How long an availability check result stays fresh.
+_AVAILABLE_TTL = 60.0
+
+# The full .info scrape is the slowest yfinance call and its fields (sector,
+# company name, trailing ratios) change at most daily, so cache it much longer.
+_INFO_CACHE: dict[str, tuple[float, dict]] = {}
+_INFO_CACHE_TTL = 86400.0
+
+# Financial statements change at most quarterly; cache the six frames longer
+# than the intraday raw data so a raw-cache miss refetches only the quote.
+_STATEMENTS_CACHE: dict[str, tuple[float, tuple]] = {}
+_STATEMENTS_CACHE_TTL = 3600.0
+
+# Column order of the materialized OHLC array in raw_data.
+_IDX_OPEN, _IDX_HIGH, _IDX_LOW, _IDX_CLOSE = range(4)
+
+# Key fields whose presence feeds the data quality score (plus 1-year growth).
+_QUALITY_KEYS = ('marketCap', 'trailingPE', 'trailingEps', 'bookValue', 'sector')
+
+# fast_info fields used for the hot price/volume metrics; everything else
+# still comes from the full .info dict.
+_FAST_INFO_KEYS = (
+    'last_price', 'previous_close', 'open', 'day_high', 'day_low',
+    'last_volume', 'market_cap', 'year_high', 'year_low'
+)
+
+# Canonical FinancialPeriod field -> statement row labels in preference order.
+# yfinance has renamed several labels over time, so the older names are kept
+# as fallbacks.
+_INCOME_FIELDS = {
+    'total_revenue': ('Total Revenue',),
+    'net_income': ('Net Income',),
+}
+_BALANCE_FIELDS = {
+    'total_assets': ('Total Assets',),
+    'total_liabilities': ('Total Liabilities Net Minority Interest', 'Total Liab'),
+    'total_equity': ('Stockholders Equity', 'Total Stockholder Equity'),
+    'shares_outstanding': ('Share Issued',),
+}
+# Quarterly balance sheets expose share counts under a different label first.
+_QUARTERLY_BALANCE_FIELDS = {
+    **_BALANCE_FIELDS,
+    'shares_outstanding': ('Ordinary Shares Number', 'Share Issued'),
+}
+_CASHFLOW_FIELDS = {
+    'operating_cash_flow': ('Operating Cash Flow', 'Total Cash From Operating Activities'),
+    'investing_cash_flow': ('Investing Cash Flow', 'Total Cash From Investing Activities'),
+    'financing_cash_flow': ('Financing Cash Flow', 'Total Cash From Financing Activities'),
+    'changes_in_cash': ('Changes In Cash', 'Net Change In Cash'),
+    'free_cash_flow': ('Free Cash Flow',),
+    'capital_expenditures': ('Capital Expenditures', 'Capital Expenditure'),
+}
+
+
+def _extract_rows(df: pd.DataFrame, fields: dict) -> dict:
+    """Resolve each canonical field to its full row of values as an ndarray.
+
+    The alias fallback runs once per frame instead of once per date, and the
+    per-date reads become positional indexing with no label hashing. Fields
+    absent from the frame are simply missing from the result.
+    """
+    rows = {}
+    index = df.index
+    for field, aliases in fields.items():
+        for alias in aliases:
+            if alias in index:
+                rows[field] = df.loc[alias].to_numpy(dtype=float)
+                break
+    return rows
+
+
+def _row_value(rows: dict, field: str, idx: Optional[int]):
+    """Read one scalar from pre-extracted statement rows by position."""
+    if idx is None:
+        return None
+    arr = rows.get(field)
+    return None if arr is None else arr[idx]
+
+
+def _normalize_metrics(current_price: float, previous_close: float,
+                       raw_pe, eps, dividend_yield, dividend_rate) -> tuple:
+    """Pure-scalar kernel for change, P/E validation and yield normalization.
+
+    Keeps the branchy float math in one place so `_process_stock_data` stays
+    linear and there is a single seam to vectorize for batch flows. Returns
+    (change, change_percent, pe_ratio, dividend_yield, extreme_yield,
+    computed_yield_percent); missing values stay None.
+    """
+    change = current_price - previous_close
+    change_percent = (change / previous_close) * 100 if previous_close > 0 else 0
+
+    # No meaningful P/E for missing or non-positive earnings, and reject
+    # values outside the reasonable business range
+    pe_ratio = None
+    if raw_pe and eps and eps > 0 and 0 <= raw_pe <= 1000:
+        pe_ratio = raw_pe
+
+    # Yahoo Finance usually reports yield as a decimal (0.0044 = 0.44%) but
+    # sometimes as a percentage already; normalize to decimal and reject
+    # extreme values
+    extreme_yield = False
+    computed_yield_percent = None
+    if dividend_yield is not None:
+        if dividend_yield <= 0:
+            dividend_yield = None
+        elif dividend_yield > 20:
+            extreme_yield = True
+            dividend_yield = None
+        elif dividend_yield > 0.20:
+            dividend_yield = dividend_yield / 100
+
+    # Derive the yield from rate and price when Yahoo omits it
+    if dividend_yield is None and dividend_rate is not None and current_price > 0:
+        calculated = (dividend_rate / current_price) * 100
+        if 0 < calculated <= 20:
+            dividend_yield = calculated / 100
+            computed_yield_percent = calculated
+
+    return change, change_percent, pe_ratio, dividend_yield, extreme_yield, computed_yield_percent
+
+
+class YFinanceStockService:
+    """Stock service implementation using Yahoo Finance.
+
+    Satisfies the StockService protocol structurally.
+    """
+
+    # Fixed attribute layout: instances are created per symbol, so dropping
+    # the per-instance __dict__ shrinks them and speeds attribute access.
+    __slots__ = ('_symbol', '_ticker', '_available_cache')
+
+    # The validator and calculator are stateless, so share one instance across
+    # all services instead of constructing one per instantiation.
+    _VALIDATOR = SymbolValidator()
+    _CALCULATOR = GrowthCalculator()
 
-class YFinanceStockService(StockService):
-    """Stock service implementation using Yahoo Finance."""
-    
     def __init__(self, symbol: str):
         """Initialize service for a specific symbol."""
         if not symbol:
             raise ValueError("Symbol cannot be empty")
-        
+
         self._symbol = symbol.upper()
-        self._validator = SymbolValidator()
-        self._calculator = GrowthCalculator()
-        
+        self._available_cache: Optional[tuple[float, bool]] = None
+
         # Validate symbol format
-        if not self._validator.is_valid_symbol(self._symbol):
+        if not self._VALIDATOR.is_valid_symbol(self._symbol):
             raise ValidationError(f"Invalid symbol format: {self._symbol}")
         
-        # Initialize ticker for this symbol
-        self._ticker = yf.Ticker(self._symbol)
+        # Initialize ticker for this symbol on the shared pooled session
+        self._ticker = yf.Ticker(self._symbol, session=_SESSION)
     
     async def get_stock_info(self) -> Optional[StockInfo]:
         """Get comprehensive stock information for the initialized symbol."""
@@ -41,155 +233,307 @@ class YFinanceStockService(StockService):
             # 1. Fetch raw data
             raw_data = await self._fetch_raw_data()
             if not raw_data:
-                logger.warning(f"No raw data available for {self._symbol}")
+                logger.warning("No raw data available for %s", self._symbol)
                 return None
             
-            # 2. Process raw data into domain model
-            stock_info = await self._process_stock_data(raw_data)
+            # 2. Process raw data into domain model, timestamped once at the
+            # fetch instant rather than per field
+            fetch_ts = datetime.now()
+            stock_info = await self._process_stock_data(raw_data, fetch_ts)
             
             if stock_info:
-                logger.info(f"Successfully fetched data for {self._symbol}")
+                logger.info("Successfully fetched data for %s", self._symbol)
                 return stock_info
             else:
-                logger.warning(f"Failed to process data for {self._symbol}")
+                logger.warning("Failed to process data for %s", self._symbol)
                 return None
                 
         except Exception as e:
-            logger.error(f"Failed to fetch data for {self._symbol}: {e}")
+            logger.error("Failed to fetch data for %s: %s", self._symbol, e)
             raise StockDataError(f"Unable to fetch data for {self._symbol}") from e
     
+    @classmethod
+    async def get_many(cls, symbols: list) -> dict:
+        """Fetch stock info for many symbols concurrently.
+
+        All fetches share the pooled session and run their blocking yfinance
+        calls in worker threads, so N symbols cost roughly one round trip
+        instead of N sequential ones. Symbols that fail map to None.
+        """
+        # Construction can fail too (invalid symbol); those map to None
+        # like fetch failures instead of sinking the whole batch.
+        services = []
+        for symbol in symbols:
+            try:
+                services.append(cls(symbol))
+            except Exception as e:
+                logger.warning("Skipping symbol %s: %s", symbol, e)
+                services.append(None)
+
+        fetched = iter(await asyncio.gather(
+            *(service.get_stock_info() for service in services if service is not None),
+            return_exceptions=True
+        ))
+        # Keyed by the caller's input strings throughout, so results can be
+        # indexed with the same symbols that were passed in.
+        results = {}
+        for symbol, service in zip(symbols, services):
+            if service is None:
+                results[symbol] = None
+            else:
+                result = next(fetched)
+                results[symbol] = None if isinstance(result, BaseException) else result
+        return results
+
     async def _fetch_raw_data(self) -> Optional[dict]:
-        """Fetch raw data from yfinance."""
+        """Fetch raw data from yfinance, serving repeat calls from a TTL cache.
+
+        Concurrent calls for the same symbol are deduplicated: only the first
+        coroutine hits the network, the rest await its result.
+        """
+        cached = _RAW_CACHE.get(self._symbol)
+        if cached is not None and time.monotonic() - cached[0] < _RAW_CACHE_TTL:
+            return cached[1]
+
+        async with _INFLIGHT_LOCK:
+            future = _INFLIGHT.get(self._symbol)
+            if future is not None:
+                owner = False
+            else:
+                future = asyncio.get_running_loop().create_future()
+                _INFLIGHT[self._symbol] = future
+                owner = True
+
+        if not owner:
+            return await asyncio.shield(future)
+
         try:
-            info = self._ticker.info
-            hist = self._ticker.history(period="2d")
-            
+            raw_data = await self._fetch_raw_data_uncached()
+            if raw_data is not None:
+                _RAW_CACHE[self._symbol] = (time.monotonic(), raw_data)
+            future.set_result(raw_data)
+            return raw_data
+        except BaseException:
+            # Don't leave waiters hanging if the owning fetch is cancelled
+            if not future.done():
+                future.set_result(None)
+            raise
+        finally:
+            _INFLIGHT.pop(self._symbol, None)
+
+    async def _fetch_raw_data_uncached(self) -> Optional[dict]:
+        """Perform the actual yfinance fetches for this symbol."""
+        try:
+            ticker = self._ticker
+            # Statements are served from their own, longer-lived cache when
+            # fresh; only the quote calls then hit the network.
+            statements = None
+            cached = _STATEMENTS_CACHE.get(self._symbol)
+            if cached is not None and time.monotonic() - cached[0] < _STATEMENTS_CACHE_TTL:
+                statements = cached[1]
+                statement_tasks = ()
+            else:
+                statement_tasks = (
+                    asyncio.to_thread(lambda: ticker.financials),
+                    asyncio.to_thread(lambda: ticker.quarterly_financials),
+                    asyncio.to_thread(lambda: ticker.balance_sheet),
+                    asyncio.to_thread(lambda: ticker.quarterly_balance_sheet),
+                    asyncio.to_thread(lambda: ticker.cashflow),
+                    asyncio.to_thread(lambda: ticker.quarterly_cashflow),
+                )
+
+            # All the yfinance calls are independent blocking HTTP fetches,
+            # so dispatch them to the thread pool together; wall time drops
+            # from the sum of the round trips to roughly the slowest one.
+            # One year of history serves both the current/previous close
+            # (last two rows) and the 52-week range.
+            results = await asyncio.gather(
+                asyncio.to_thread(self._get_info),
+                asyncio.to_thread(self._read_fast_info),
+                asyncio.to_thread(ticker.history, period="1y"),
+                *statement_tasks,
+                return_exceptions=True
+            )
+            info, fast_info, hist = results[0], results[1], results[2]
+            if isinstance(info, BaseException):
+                raise info
+            if isinstance(hist, BaseException):
+                raise hist
+            if isinstance(fast_info, BaseException):
+                fast_info = {}
+            if statements is None:
+                # A failed statement fetch only costs the financial history,
+                # not the whole quote; substitute an empty frame and carry on.
+                statements = tuple(
+                    pd.DataFrame() if isinstance(result, BaseException) else result
+                    for result in results[3:]
+                )
+                if any(not frame.empty for frame in statements):
+                    _STATEMENTS_CACHE[self._symbol] = (time.monotonic(), statements)
+
             if not info or hist.empty:
                 return None
-            
+
             # Validate essential data exists
             if 'symbol' not in info and 'shortName' not in info:
                 return None
-            
-            return {
+
+            # Materialize the OHLC columns once as a contiguous float array;
+            # downstream reads become direct C-level indexing instead of
+            # pandas label lookups.
+            ohlc = hist[['Open', 'High', 'Low', 'Close']].to_numpy(dtype=float)
+            # Volume is kept as its own int64 array so the read below is a
+            # direct integer index with no float round-trip.
+            volume = hist['Volume'].to_numpy(dtype='int64')
+
+            raw_data = {
                 'info': info,
-                'hist': hist
+                'fast_info': fast_info,
+                'hist': hist,
+                'ohlc': ohlc,
+                'volume': volume,
+                'statements': statements
             }
-            
+            return raw_data
+
         except Exception as e:
-            logger.error(f"Error fetching raw data for {self._symbol}: {e}")
+            logger.error("Error fetching raw data for %s: %s", self._symbol, e)
             return None
+
+    def _get_info(self) -> Optional[dict]:
+        """Get the full .info dict, cached with a long TTL (changes at most daily)."""
+        cached = _INFO_CACHE.get(self._symbol)
+        if cached is not None and time.monotonic() - cached[0] < _INFO_CACHE_TTL:
+            return cached[1]
+
+        info = self._ticker.info
+        if info:
+            _INFO_CACHE[self._symbol] = (time.monotonic(), info)
+        return info
+
+    def _read_fast_info(self) -> dict:
+        """Read hot price/volume metrics from the lightweight fast_info endpoint."""
+        fast: dict = {}
+        try:
+            fi = self._ticker.fast_info
+            for key in _FAST_INFO_KEYS:
+                try:
+                    value = fi[key]
+                except (KeyError, AttributeError):
+                    continue
+                if value is not None:
+                    fast[key] = value
+        except Exception as e:
+            logger.debug("fast_info unavailable for %s: %s", self._symbol, e)
+        return fast
     
-    async def _process_stock_data(self, raw_data: dict) -> Optional[StockInfo]:
+    async def _process_stock_data(self, raw_data: dict, fetch_ts: Optional[datetime] = None) -> Optional[StockInfo]:
         """Process raw data into domain model."""
+        if fetch_ts is None:
+            fetch_ts = datetime.now()
         try:
             info = raw_data['info']
+            fast_info = raw_data.get('fast_info') or {}
             hist = raw_data['hist']
-            
-            # Calculate current price and change
-            current_price = float(hist.iloc[-1]['Close'])
-            previous_close = float(hist.iloc[-2]['Close']) if len(hist) > 1 else current_price
-            change = current_price - previous_close
-            change_percent = (change / previous_close) * 100 if previous_close > 0 else 0
-            
-            # Apply business logic for financial metrics
+
+            # Read price fields from the pre-materialized OHLC array; the
+            # last row is a direct ndarray index, no pandas dispatch.
+            ohlc = raw_data.get('ohlc')
+            if ohlc is None:
+                ohlc = hist[['Open', 'High', 'Low', 'Close']].to_numpy(dtype=float)
+            volume_arr = raw_data.get('volume')
+            if volume_arr is None:
+                volume_arr = hist['Volume'].to_numpy(dtype='int64')
+            last = ohlc[-1]
+
+            # Calculate current price and change, preferring the lightweight
+            # fast_info values and falling back to the history data.
+            last_price = fast_info.get('last_price')
+            current_price = float(last_price) if last_price else float(last[_IDX_CLOSE])
+            prev_close = fast_info.get('previous_close')
+            if prev_close:
+                previous_close = float(prev_close)
+            else:
+                previous_close = float(ohlc[-2, _IDX_CLOSE]) if ohlc.shape[0] > 1 else current_price
+            # Normalize the scalar metrics in one pass
             eps = info.get('trailingEps')
-            pe_ratio = self._calculate_pe_ratio(info.get('trailingPE'), eps)
-            
+            raw_dividend_yield = info.get('dividendYield') or info.get('trailingAnnualDividendYield')
+            dividend_rate = info.get('dividendRate') or info.get('trailingAnnualDividendRate')
+            (change, change_percent, raw_pe_ratio, dividend_yield,
+             extreme_yield, computed_yield_percent) = _normalize_metrics(
+                current_price, previous_close, info.get('trailingPE'), eps,
+                raw_dividend_yield, dividend_rate)
+            pe_ratio = _to_money(raw_pe_ratio) if raw_pe_ratio is not None else None
+            if extreme_yield:
+                logger.warning("Extreme dividend yield for %s: %s%%", self._symbol, raw_dividend_yield)
+            if computed_yield_percent is not None:
+                logger.info("Calculated dividend yield for %s: %.2f%%", self._symbol, computed_yield_percent)
+
             # Calculate growth metrics
             growth_metrics = await self._calculate_growth_metrics()
             
             # Calculate price range
-            price_range = await self._calculate_price_range(hist)
+            price_range = self._calculate_price_range(hist, ohlc)
             
-            # Calculate financial history
-            financial_history = await self._calculate_financial_history()
+            # Calculate financial history from the pre-fetched statements
+            financial_history = await self._calculate_financial_history(raw_data.get('statements'))
             
-            # Extract dividend information - try different field names
-            dividend_yield = info.get('dividendYield') or info.get('trailingAnnualDividendYield')
-            dividend_rate = info.get('dividendRate') or info.get('trailingAnnualDividendRate')
+            # Dividend dates come straight from info as Unix timestamps
             ex_dividend_date = info.get('exDividendDate')
             dividend_date = info.get('dividendDate')
-            
 
-            
-            # Validate dividend yield is reasonable (Yahoo Finance returns as decimal, so 0.20 = 20%)
-            # But sometimes it returns as percentage already, so check both ranges
-            if dividend_yield is not None:
-                if dividend_yield <= 0:
-                    dividend_yield = None
-                elif dividend_yield > 20:  # If > 20, likely already in percentage format, reject extreme values
-                    logger.warning(f"Extreme dividend yield for {self._symbol}: {dividend_yield}%")
-                    dividend_yield = None
-                elif dividend_yield > 0.20:  # Between 0.20 and 20, assume it's percentage format
-                    dividend_yield = dividend_yield / 100  # Convert to decimal format
-            
-            # Calculate dividend yield manually if we have dividend rate and current price
-            if dividend_yield is None and dividend_rate is not None and current_price > 0:
-                calculated_yield_percent = (dividend_rate / current_price) * 100
-                if 0 < calculated_yield_percent <= 20:  # Reasonable range
-                    dividend_yield = calculated_yield_percent / 100  # Store as decimal (0.0051 for 0.51%)
-                    logger.info(f"Calculated dividend yield for {self._symbol}: {calculated_yield_percent:.2f}%")
-            
             # Build domain model
             stock_info = StockInfo(
                 symbol=self._symbol,
                 company_name=info.get('longName', info.get('shortName', f"{self._symbol} Corporation")),
-                current_price=Decimal(str(current_price)),
-                change=Decimal(str(change)),
-                change_percent=Decimal(str(change_percent)),
-                open_price=Decimal(str(float(hist.iloc[-1]['Open']))),
-                high_price=Decimal(str(float(hist.iloc[-1]['High']))),
-                low_price=Decimal(str(float(hist.iloc[-1]['Low']))),
-                volume=int(hist.iloc[-1]['Volume']),
-                market_cap=info.get('marketCap'),
+                current_price=_to_money(current_price),
+                change=_to_money(change),
+                change_percent=_to_money(change_percent),
+                open_price=_to_money(fast_info.get('open') or last[_IDX_OPEN]),
+                high_price=_to_money(fast_info.get('day_high') or last[_IDX_HIGH]),
+                low_price=_to_money(fast_info.get('day_low') or last[_IDX_LOW]),
+                volume=int(fast_info.get('last_volume') or volume_arr[-1]),
+                market_cap=info.get('marketCap') or fast_info.get('market_cap'),
                 pe_ratio=pe_ratio,
-                eps=Decimal(str(eps)) if eps is not None else None,
-                book_value=Decimal(str(info.get('bookValue'))) if info.get('bookValue') else None,
-                dividend_yield=Decimal(str(dividend_yield * 100)) if dividend_yield is not None and dividend_yield > 0 else None,  # Convert decimal to percentage for storage
-                dividend_rate=Decimal(str(dividend_rate)) if dividend_rate is not None else None,
-                ex_dividend_date=datetime.fromtimestamp(ex_dividend_date) if ex_dividend_date else None,
-                dividend_date=datetime.fromtimestamp(dividend_date) if dividend_date else None,
+                eps=_to_money(eps) if eps is not None else None,
+                book_value=_to_money(info.get('bookValue')) if info.get('bookValue') else None,
+                dividend_yield=_to_money(dividend_yield * 100) if dividend_yield is not None and dividend_yield > 0 else None,  # Convert decimal to percentage for storage
+                dividend_rate=_to_money(dividend_rate) if dividend_rate is not None else None,
+                # Explicit UTC skips the local-timezone lookup fromtimestamp
+                # does per call; Yahoo reports these as UTC epochs anyway
+                ex_dividend_date=datetime.fromtimestamp(ex_dividend_date, tz=timezone.utc) if ex_dividend_date else None,
+                dividend_date=datetime.fromtimestamp(dividend_date, tz=timezone.utc) if dividend_date else None,
                 sector=info.get('sector'),
                 quote_type=info.get('quoteType'),
                 category=info.get('category'),
                 growth_metrics=growth_metrics,
                 price_range=price_range,
                 financial_history=financial_history,
-                last_updated=datetime.now(),
+                last_updated=fetch_ts,
                 data_quality_score=self._calculate_data_quality_score(info, growth_metrics)
             )
             
             return stock_info
             
         except Exception as e:
-            logger.error(f"Error processing stock data for {self._symbol}: {e}")
+            logger.error("Error processing stock data for %s: %s", self._symbol, e)
             return None
     
-    def _calculate_pe_ratio(self, raw_pe: Optional[float], eps: Optional[float]) -> Optional[Decimal]:
-        """Apply business logic for P/E ratio calculation."""
-        if not raw_pe or not eps:
-            return None
-        
-        # No meaningful P/E for negative earnings
-        if eps <= 0:
-            return None
-        
-        # Validate reasonable P/E range (business rule)
-        if raw_pe < 0 or raw_pe > 1000:
-            return None
-        
-        return Decimal(str(raw_pe))
-    
     async def _calculate_growth_metrics(self) -> Optional[GrowthMetrics]:
         """Calculate growth metrics using the initialized ticker."""
         try:
-            growth_1y = await self._calculator.calculate_growth(self._ticker, "1y")
-            growth_2y = await self._calculator.calculate_growth(self._ticker, "2y")
-            growth_3y = await self._calculator.calculate_growth(self._ticker, "3y")
-            growth_5y = await self._calculator.calculate_growth(self._ticker, "5y")
-            growth_10y = await self._calculator.calculate_growth(self._ticker, "10y")
-            
+            # The five period fetches are independent, so run them concurrently;
+            # wall time drops to roughly the slowest single fetch.
+            results = await asyncio.gather(
+                *(self._CALCULATOR.calculate_growth(self._ticker, period)
+                  for period in ("1y", "2y", "3y", "5y", "10y")),
+                return_exceptions=True
+            )
+            growth_1y, growth_2y, growth_3y, growth_5y, growth_10y = (
+                None if isinstance(result, BaseException) else result
+                for result in results
+            )
+
             return GrowthMetrics(
                 one_year=growth_1y,
                 two_years=growth_2y,
@@ -198,246 +542,160 @@ class YFinanceStockService(StockService):
                 ten_years=growth_10y
             )
         except Exception as e:
-            logger.warning(f"Failed to calculate growth metrics for {self._symbol}: {e}")
+            logger.warning("Failed to calculate growth metrics for %s: %s", self._symbol, e)
             return None
     
-    async def _calculate_price_range(self, recent_hist) -> Optional[PriceRange]:
-        """Calculate price ranges using the initialized ticker."""
+    def _calculate_price_range(self, hist_52w, ohlc=None) -> Optional[PriceRange]:
+        """Calculate price ranges from the already-fetched year of history.
+
+        Plain sync: it is pure array math with nothing to await, so declaring
+        it a coroutine only added scheduling overhead.
+        """
         try:
-            # Get 52-week data using the same ticker
-            hist_52w = self._ticker.history(period="1y")
             if hist_52w.empty:
                 return None
-            
-            week_52_low = float(hist_52w['Low'].min())
-            week_52_high = float(hist_52w['High'].max())
-            day_low = float(recent_hist.iloc[-1]['Low'])
-            day_high = float(recent_hist.iloc[-1]['High'])
+
+            # Reuse the OHLC array materialized at fetch time; the column
+            # slices are views, so the reductions and last-row day values run
+            # on raw float64 data with no further copies.
+            if ohlc is None:
+                ohlc = hist_52w[['Open', 'High', 'Low', 'Close']].to_numpy(dtype=float)
+            low_arr = ohlc[:, _IDX_LOW]
+            high_arr = ohlc[:, _IDX_HIGH]
+            week_52_low = float(low_arr.min())
+            week_52_high = float(high_arr.max())
+            day_low = float(low_arr[-1])
+            day_high = float(high_arr[-1])
             
             return PriceRange(
-                week_52_low=Decimal(str(week_52_low)),
-                week_52_high=Decimal(str(week_52_high)),
-                day_low=Decimal(str(day_low)),
-                day_high=Decimal(str(day_high))
+                week_52_low=_to_money(week_52_low),
+                week_52_high=_to_money(week_52_high),
+                day_low=_to_money(day_low),
+                day_high=_to_money(day_high)
             )
         except Exception as e:
-            logger.warning(f"Failed to calculate price range: {e}")
+            logger.warning("Failed to calculate price range: %s", e)
             return None
     
-    async def _calculate_financial_history(self) -> Optional[FinancialHistory]:
-        """Calculate financial history from Yahoo Finance data."""
+    async def _calculate_financial_history(self, statements: Optional[tuple] = None) -> Optional[FinancialHistory]:
+        """Calculate financial history from Yahoo Finance data.
+
+        The six statement frames are normally pre-fetched in parallel by
+        `_fetch_raw_data_uncached` and passed in; fetching here (off the event
+        loop) is kept as a fallback for callers without them.
+        """
         try:
-            # Get financial statements
-            annual_financials = self._ticker.financials
-            quarterly_financials = self._ticker.quarterly_financials
-            annual_balance_sheet = self._ticker.balance_sheet
-            quarterly_balance_sheet = self._ticker.quarterly_balance_sheet
-            annual_cash_flow = self._ticker.cashflow
-            quarterly_cash_flow = self._ticker.quarterly_cashflow
-            
+            if statements is None:
+                ticker = self._ticker
+                statements = await asyncio.gather(
+                    asyncio.to_thread(lambda: ticker.financials),
+                    asyncio.to_thread(lambda: ticker.quarterly_financials),
+                    asyncio.to_thread(lambda: ticker.balance_sheet),
+                    asyncio.to_thread(lambda: ticker.quarterly_balance_sheet),
+                    asyncio.to_thread(lambda: ticker.cashflow),
+                    asyncio.to_thread(lambda: ticker.quarterly_cashflow)
+                )
+            (annual_financials, quarterly_financials,
+             annual_balance_sheet, quarterly_balance_sheet,
+             annual_cash_flow, quarterly_cash_flow) = statements
+
             financial_history = FinancialHistory()
-            
-            # Process annual data
-            if not annual_financials.empty and not annual_balance_sheet.empty:
-                annual_periods = []
-                
-                # Get up to 4 years of data
-                for date in annual_financials.columns[:4]:
-                    try:
-                        # Income statement data
-                        total_revenue = annual_financials.loc['Total Revenue', date] if 'Total Revenue' in annual_financials.index else None
-                        net_income = annual_financials.loc['Net Income', date] if 'Net Income' in annual_financials.index else None
-                        
-                        # Balance sheet data - using correct Yahoo Finance field names with fallbacks
-                        total_assets = None
-                        if 'Total Assets' in annual_balance_sheet.index:
-                            total_assets = annual_balance_sheet.loc['Total Assets', date]
-                        
-                        total_liab = None
-                        if 'Total Liabilities Net Minority Interest' in annual_balance_sheet.index:
-                            total_liab = annual_balance_sheet.loc['Total Liabilities Net Minority Interest', date]
-                        elif 'Total Liab' in annual_balance_sheet.index:
-                            total_liab = annual_balance_sheet.loc['Total Liab', date]
-                        
-                        total_equity = None
-                        if 'Stockholders Equity' in annual_balance_sheet.index:
-                            total_equity = annual_balance_sheet.loc['Stockholders Equity', date]
-                        elif 'Total Stockholder Equity' in annual_balance_sheet.index:
-                            total_equity = annual_balance_sheet.loc['Total Stockholder Equity', date]
-                        shares_outstanding = annual_balance_sheet.loc['Share Issued', date] if 'Share Issued' in annual_balance_sheet.index else None
-                        
-                        # Cash flow data (if available for this date)
-                        operating_cash_flow = None
-                        investing_cash_flow = None
-                        financing_cash_flow = None
-                        changes_in_cash = None
-                        free_cash_flow = None
-                        
-                        if not annual_cash_flow.empty and date in annual_cash_flow.columns:
-                            # Common yfinance cash flow field names with fallbacks
-                            if 'Operating Cash Flow' in annual_cash_flow.index:
-                                operating_cash_flow = annual_cash_flow.loc['Operating Cash Flow', date]
-                            elif 'Total Cash From Operating Activities' in annual_cash_flow.index:
-                                operating_cash_flow = annual_cash_flow.loc['Total Cash From Operating Activities', date]
-                            
-                            if 'Investing Cash Flow' in annual_cash_flow.index:
-                                investing_cash_flow = annual_cash_flow.loc['Investing Cash Flow', date]
-                            elif 'Total Cash From Investing Activities' in annual_cash_flow.index:
-                                investing_cash_flow = annual_cash_flow.loc['Total Cash From Investing Activities', date]
-                            
-                            if 'Financing Cash Flow' in annual_cash_flow.index:
-                                financing_cash_flow = annual_cash_flow.loc['Financing Cash Flow', date]
-                            elif 'Total Cash From Financing Activities' in annual_cash_flow.index:
-                                financing_cash_flow = annual_cash_flow.loc['Total Cash From Financing Activities', date]
-                            
-                            if 'Changes In Cash' in annual_cash_flow.index:
-                                changes_in_cash = annual_cash_flow.loc['Changes In Cash', date]
-                            elif 'Net Change In Cash' in annual_cash_flow.index:
-                                changes_in_cash = annual_cash_flow.loc['Net Change In Cash', date]
-                            
-                            if 'Free Cash Flow' in annual_cash_flow.index:
-                                free_cash_flow = annual_cash_flow.loc['Free Cash Flow', date]
-                            elif operating_cash_flow is not None:
-                                # Calculate free cash flow if not directly available
-                                capex = None
-                                if 'Capital Expenditures' in annual_cash_flow.index:
-                                    capex = annual_cash_flow.loc['Capital Expenditures', date]
-                                elif 'Capital Expenditure' in annual_cash_flow.index:
-                                    capex = annual_cash_flow.loc['Capital Expenditure', date]
-                                
-                                if capex is not None:
-                                    # CapEx is usually negative in yfinance, so we add it (subtract the absolute value)
-                                    free_cash_flow = operating_cash_flow + capex
-                        
-                        period = FinancialPeriod(
-                            date=date.to_pydatetime(),
-                            total_revenue=Decimal(str(total_revenue)) if total_revenue is not None and not pd.isna(total_revenue) else None,
-                            net_income=Decimal(str(net_income)) if net_income is not None and not pd.isna(net_income) else None,
-                            total_assets=Decimal(str(total_assets)) if total_assets is not None and not pd.isna(total_assets) else None,
-                            total_liabilities=Decimal(str(total_liab)) if total_liab is not None and not pd.isna(total_liab) else None,
-                            total_equity=Decimal(str(total_equity)) if total_equity is not None and not pd.isna(total_equity) else None,
-                            shares_outstanding=int(shares_outstanding) if shares_outstanding is not None and not pd.isna(shares_outstanding) else None,
-                            operating_cash_flow=Decimal(str(operating_cash_flow)) if operating_cash_flow is not None and not pd.isna(operating_cash_flow) else None,
-                            investing_cash_flow=Decimal(str(investing_cash_flow)) if investing_cash_flow is not None and not pd.isna(investing_cash_flow) else None,
-                            financing_cash_flow=Decimal(str(financing_cash_flow)) if financing_cash_flow is not None and not pd.isna(financing_cash_flow) else None,
-                            changes_in_cash=Decimal(str(changes_in_cash)) if changes_in_cash is not None and not pd.isna(changes_in_cash) else None,
-                            free_cash_flow=Decimal(str(free_cash_flow)) if free_cash_flow is not None and not pd.isna(free_cash_flow) else None
-                        )
-                        annual_periods.append(period)
-                        
-                    except (KeyError, ValueError, TypeError) as e:
-                        logger.debug(f"Error processing annual data for {date}: {e}")
-                        continue
-                
-                financial_history.annual_periods = annual_periods
-            
-            # Process quarterly data
-            if not quarterly_financials.empty:
-                quarterly_periods = []
-                
-                # Get up to 4 quarters of data
-                for date in quarterly_financials.columns[:4]:
-                    try:
-                        # Income statement data
-                        total_revenue = quarterly_financials.loc['Total Revenue', date] if 'Total Revenue' in quarterly_financials.index else None
-                        net_income = quarterly_financials.loc['Net Income', date] if 'Net Income' in quarterly_financials.index else None
-                        
-                        # Balance sheet data (if available for this quarter)
-                        total_assets = None
-                        total_liab = None
-                        total_equity = None
-                        shares_outstanding = None
-                        
-                        if not quarterly_balance_sheet.empty and date in quarterly_balance_sheet.columns:
-                            if 'Total Assets' in quarterly_balance_sheet.index:
-                                total_assets = quarterly_balance_sheet.loc['Total Assets', date]
-                            
-                            if 'Total Liabilities Net Minority Interest' in quarterly_balance_sheet.index:
-                                total_liab = quarterly_balance_sheet.loc['Total Liabilities Net Minority Interest', date]
-                            elif 'Total Liab' in quarterly_balance_sheet.index:
-                                total_liab = quarterly_balance_sheet.loc['Total Liab', date]
-                            
-                            if 'Stockholders Equity' in quarterly_balance_sheet.index:
-                                total_equity = quarterly_balance_sheet.loc['Stockholders Equity', date]
-                            elif 'Total Stockholder Equity' in quarterly_balance_sheet.index:
-                                total_equity = quarterly_balance_sheet.loc['Total Stockholder Equity', date]
-                            
-                            if 'Ordinary Shares Number' in quarterly_balance_sheet.index:
-                                shares_outstanding = quarterly_balance_sheet.loc['Ordinary Shares Number', date]
-                            elif 'Share Issued' in quarterly_balance_sheet.index:
-                                shares_outstanding = quarterly_balance_sheet.loc['Share Issued', date]
-                        
-                        # Cash flow data (if available for this quarter)
-                        operating_cash_flow = None
-                        investing_cash_flow = None
-                        financing_cash_flow = None
-                        changes_in_cash = None
-                        free_cash_flow = None
-                        
-                        if not quarterly_cash_flow.empty and date in quarterly_cash_flow.columns:
-                            # Common yfinance cash flow field names with fallbacks
-                            if 'Operating Cash Flow' in quarterly_cash_flow.index:
-                                operating_cash_flow = quarterly_cash_flow.loc['Operating Cash Flow', date]
-                            elif 'Total Cash From Operating Activities' in quarterly_cash_flow.index:
-                                operating_cash_flow = quarterly_cash_flow.loc['Total Cash From Operating Activities', date]
-                            
-                            if 'Investing Cash Flow' in quarterly_cash_flow.index:
-                                investing_cash_flow = quarterly_cash_flow.loc['Investing Cash Flow', date]
-                            elif 'Total Cash From Investing Activities' in quarterly_cash_flow.index:
-                                investing_cash_flow = quarterly_cash_flow.loc['Total Cash From Investing Activities', date]
-                            
-                            if 'Financing Cash Flow' in quarterly_cash_flow.index:
-                                financing_cash_flow = quarterly_cash_flow.loc['Financing Cash Flow', date]
-                            elif 'Total Cash From Financing Activities' in quarterly_cash_flow.index:
-                                financing_cash_flow = quarterly_cash_flow.loc['Total Cash From Financing Activities', date]
-                            
-                            if 'Changes In Cash' in quarterly_cash_flow.index:
-                                changes_in_cash = quarterly_cash_flow.loc['Changes In Cash', date]
-                            elif 'Net Change In Cash' in quarterly_cash_flow.index:
-                                changes_in_cash = quarterly_cash_flow.loc['Net Change In Cash', date]
-                            
-                            if 'Free Cash Flow' in quarterly_cash_flow.index:
-                                free_cash_flow = quarterly_cash_flow.loc['Free Cash Flow', date]
-                            elif operating_cash_flow is not None:
-                                # Calculate free cash flow if not directly available
-                                capex = None
-                                if 'Capital Expenditures' in quarterly_cash_flow.index:
-                                    capex = quarterly_cash_flow.loc['Capital Expenditures', date]
-                                elif 'Capital Expenditure' in quarterly_cash_flow.index:
-                                    capex = quarterly_cash_flow.loc['Capital Expenditure', date]
-                                
-                                if capex is not None:
-                                    # CapEx is usually negative in yfinance, so we add it (subtract the absolute value)
-                                    free_cash_flow = operating_cash_flow + capex
-                        
-                        period = FinancialPeriod(
-                            date=date.to_pydatetime(),
-                            total_revenue=Decimal(str(total_revenue)) if total_revenue is not None and not pd.isna(total_revenue) else None,
-                            net_income=Decimal(str(net_income)) if net_income is not None and not pd.isna(net_income) else None,
-                            total_assets=Decimal(str(total_assets)) if total_assets is not None and not pd.isna(total_assets) else None,
-                            total_liabilities=Decimal(str(total_liab)) if total_liab is not None and not pd.isna(total_liab) else None,
-                            total_equity=Decimal(str(total_equity)) if total_equity is not None and not pd.isna(total_equity) else None,
-                            shares_outstanding=int(shares_outstanding) if shares_outstanding is not None and not pd.isna(shares_outstanding) else None,
-                            operating_cash_flow=Decimal(str(operating_cash_flow)) if operating_cash_flow is not None and not pd.isna(operating_cash_flow) else None,
-                            investing_cash_flow=Decimal(str(investing_cash_flow)) if investing_cash_flow is not None and not pd.isna(investing_cash_flow) else None,
-                            financing_cash_flow=Decimal(str(financing_cash_flow)) if financing_cash_flow is not None and not pd.isna(financing_cash_flow) else None,
-                            changes_in_cash=Decimal(str(changes_in_cash)) if changes_in_cash is not None and not pd.isna(changes_in_cash) else None,
-                            free_cash_flow=Decimal(str(free_cash_flow)) if free_cash_flow is not None and not pd.isna(free_cash_flow) else None
-                        )
-                        quarterly_periods.append(period)
-                        
-                    except (KeyError, ValueError, TypeError) as e:
-                        logger.debug(f"Error processing quarterly data for {date}: {e}")
-                        continue
-                
-                financial_history.quarterly_periods = quarterly_periods
-            
+
+            # Annual periods require a balance sheet for the date (matching
+            # the historical behaviour); quarterly periods tolerate gaps.
+            financial_history.annual_periods = self._build_periods(
+                'annual', annual_financials, annual_balance_sheet,
+                annual_cash_flow, _BALANCE_FIELDS, require_balance=True)
+            financial_history.quarterly_periods = self._build_periods(
+                'quarterly', quarterly_financials, quarterly_balance_sheet,
+                quarterly_cash_flow, _QUARTERLY_BALANCE_FIELDS,
+                require_balance=False)
+
             return financial_history if (financial_history.annual_periods or financial_history.quarterly_periods) else None
             
         except Exception as e:
-            logger.warning(f"Failed to calculate financial history for {self._symbol}: {e}")
+            logger.warning("Failed to calculate financial history for %s: %s", self._symbol, e)
             return None
     
+    def _build_periods(self, label: str, financials, balance_sheet, cash_flow,
+                       balance_fields: dict, require_balance: bool,
+                       max_periods: int = 4) -> list:
+        """Build FinancialPeriod entries from one statement trio.
+
+        Single copy of the extraction logic shared by the annual and
+        quarterly paths: rows are resolved once per frame, per-date reads are
+        positional. With `require_balance`, periods whose date is missing
+        from the balance sheet are skipped.
+        """
+        # Empty statements short-circuit before any per-date work; with a
+        # required balance sheet missing there is nothing to build at all.
+        if financials.empty or (require_balance and balance_sheet.empty):
+            return []
+
+        income_rows = _extract_rows(financials, _INCOME_FIELDS)
+        if balance_sheet.empty:
+            balance_rows, balance_cols = {}, {}
+        else:
+            balance_rows = _extract_rows(balance_sheet, balance_fields)
+            balance_cols = {col: i for i, col in enumerate(balance_sheet.columns)}
+        if cash_flow.empty:
+            cashflow_rows, cashflow_cols = {}, {}
+        else:
+            cashflow_rows = _extract_rows(cash_flow, _CASHFLOW_FIELDS)
+            cashflow_cols = {col: i for i, col in enumerate(cash_flow.columns)}
+
+        periods = []
+        for idx, date in enumerate(financials.columns[:max_periods]):
+            try:
+                # Income statement data
+                total_revenue = _row_value(income_rows, 'total_revenue', idx)
+                net_income = _row_value(income_rows, 'net_income', idx)
+
+                # Balance sheet data
+                balance_idx = balance_cols.get(date)
+                if require_balance and balance_idx is None:
+                    continue
+                total_assets = _row_value(balance_rows, 'total_assets', balance_idx)
+                total_liab = _row_value(balance_rows, 'total_liabilities', balance_idx)
+                total_equity = _row_value(balance_rows, 'total_equity', balance_idx)
+                shares_outstanding = _row_value(balance_rows, 'shares_outstanding', balance_idx)
+
+                # Cash flow data (if available for this period)
+                cashflow_idx = cashflow_cols.get(date)
+                operating_cash_flow = _row_value(cashflow_rows, 'operating_cash_flow', cashflow_idx)
+                investing_cash_flow = _row_value(cashflow_rows, 'investing_cash_flow', cashflow_idx)
+                financing_cash_flow = _row_value(cashflow_rows, 'financing_cash_flow', cashflow_idx)
+                changes_in_cash = _row_value(cashflow_rows, 'changes_in_cash', cashflow_idx)
+                free_cash_flow = _row_value(cashflow_rows, 'free_cash_flow', cashflow_idx)
+                if free_cash_flow is None and operating_cash_flow is not None:
+                    # Calculate free cash flow if not directly available;
+                    # CapEx is usually negative in yfinance, so adding it
+                    # subtracts the outflow
+                    capex = _row_value(cashflow_rows, 'capital_expenditures', cashflow_idx)
+                    if capex is not None:
+                        free_cash_flow = operating_cash_flow + capex
+
+                periods.append(FinancialPeriod(
+                    date=date.to_pydatetime(),
+                    total_revenue=_dec(total_revenue),
+                    net_income=_dec(net_income),
+                    total_assets=_dec(total_assets),
+                    total_liabilities=_dec(total_liab),
+                    total_equity=_dec(total_equity),
+                    shares_outstanding=_int(shares_outstanding),
+                    operating_cash_flow=_dec(operating_cash_flow),
+                    investing_cash_flow=_dec(investing_cash_flow),
+                    financing_cash_flow=_dec(financing_cash_flow),
+                    changes_in_cash=_dec(changes_in_cash),
+                    free_cash_flow=_dec(free_cash_flow)
+                ))
+
+            except (KeyError, ValueError, TypeError) as e:
+                logger.debug("Error processing %s data for %s: %s", label, date, e)
+                continue
+
+        return periods
+
     def _validate_financial_period_data(self, market_cap: Optional[int], revenue: Optional[float], 
                                        assets: Optional[float], operating_cf: Optional[float]) -> bool:
         """Validate financial period data for reasonableness against market cap."""
@@ -458,50 +716,47 @@ class YFinanceStockService(StockService):
         ]
         
         for name, value in values_to_check:
-            if value is not None and not pd.isna(value):
+            if value is not None and value == value:
                 # Convert to millions for comparison
                 value_millions = abs(value) / 1_000_000
                 ratio = value_millions / market_cap_millions
                 
                 if ratio > max_reasonable_ratio:
-                    logger.warning(f"Suspicious {name} data for {self._symbol}: ${value_millions:.0f}M vs market cap ${market_cap_millions:.0f}M (ratio: {ratio:.1f}x)")
+                    logger.warning("Suspicious %s data for %s: $%.0fM vs market cap $%.0fM (ratio: %.1fx)", name, self._symbol, value_millions, market_cap_millions, ratio)
                     return False
         
         return True
     
     def _calculate_data_quality_score(self, info: dict, growth_metrics: Optional[GrowthMetrics]) -> float:
         """Calculate data quality score based on available information."""
-        score = 0.0
-        total_fields = 6
-        
-        # Check availability of key fields
-        if info.get('marketCap'):
-            score += 1
-        if info.get('trailingPE'):
-            score += 1
-        if info.get('trailingEps'):
-            score += 1
-        if info.get('bookValue'):
-            score += 1
-        if info.get('sector'):
-            score += 1
-        if growth_metrics and growth_metrics.one_year is not None:
-            score += 1
-        
-        return score / total_fields
+        # Booleans count as 0/1, so the growth bonus folds into the sum
+        score = sum(1 for key in _QUALITY_KEYS if info.get(key)) + (
+            growth_metrics is not None and growth_metrics.one_year is not None)
+        return score / 6
     
     def validate_symbol(self, symbol: str) -> bool:
         """Validate stock symbol format."""
-        return self._validator.is_valid_symbol(symbol)
+        return self._VALIDATOR.is_valid_symbol(symbol)
     
     def is_available(self) -> bool:
-        """Check if YFinance service is available."""
+        """Check if YFinance service is available.
+
+        The result is memoized briefly so health-check polling doesn't fire
+        a full .info scrape on every call.
+        """
+        cached = self._available_cache
+        if cached is not None and time.monotonic() - cached[0] < _AVAILABLE_TTL:
+            return cached[1]
+
         try:
-            # Simple availability check using our ticker
-            info = self._ticker.info
-            return bool(info and ('symbol' in info or 'shortName' in info))
+            # Simple availability check using our (cached) info fetch
+            info = self._get_info()
+            result = bool(info and ('symbol' in info or 'shortName' in info))
         except Exception:
-            return False
+            result = False
+
+        self._available_cache = (time.monotonic(), result)
+        return result
     
     @property
     def service_name(self) -> str:
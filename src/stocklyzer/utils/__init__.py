@@ -3,8 +3,9 @@
 from .exceptions import StocklyzerError, ValidationError, StockDataError, ServiceUnavailableError
 from .validators import SymbolValidator
 from .calculations import GrowthCalculator
+from .ticker_bundle import TickerBundle
 
 __all__ = [
     'StocklyzerError', 'ValidationError', 'StockDataError', 'ServiceUnavailableError',
-    'SymbolValidator', 'GrowthCalculator'
+    'SymbolValidator', 'GrowthCalculator', 'TickerBundle'
 ]
\ No newline at end of file
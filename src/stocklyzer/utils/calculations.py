@@ -1,57 +1,97 @@
 """Growth calculation utilities."""
 
+import asyncio
 import yfinance as yf
+import pandas as pd
 from decimal import Decimal
-from datetime import datetime, timedelta
 from typing import Optional
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Module-level so the maps are built once, not per call.
+_PERIOD_YEARS = {
+    "1y": 1,
+    "2y": 2,
+    "3y": 3,
+    "5y": 5,
+    "10y": 10
+}
+# Precomputed pd.Timedelta per period: the full slice span for prefetched
+# history and the minimum coverage (80% of the span) accepted before a
+# period is considered to have enough data. Timedelta compares directly
+# against tz-aware Timestamps, so no per-call timedelta construction.
+_PERIOD_SPAN = {p: pd.Timedelta(days=y * 365) for p, y in _PERIOD_YEARS.items()}
+_REQUIRED_LOOKBACK = {p: pd.Timedelta(days=int(y * 365 * 0.8))
+                      for p, y in _PERIOD_YEARS.items()}
+
+
+def _growth(start: float, end: float) -> float:
+    """Scalar growth kernel; NaN marks a non-positive start price.
+
+    Pure float math kept free of pandas/Decimal so it stays cheap and
+    compilable if growth ever runs over whole arrays. The fixed f8->f8
+    signature means a jit backend could compile it at import time rather
+    than on first call.
+    """
+    if start <= 0.0:
+        return float('nan')
+    return (end - start) / start * 100.0
+
 
 class GrowthCalculator:
     """Handles growth calculations with date validation."""
-    
-    async def calculate_growth(self, ticker: yf.Ticker, period: str) -> Optional[Decimal]:
-        """Calculate growth for a specific period using existing ticker."""
+
+    # Stateless; no per-instance __dict__ needed.
+    __slots__ = ()
+
+    async def calculate_growth(self, ticker: yf.Ticker, period: str,
+                               history: Optional[pd.DataFrame] = None) -> Optional[Decimal]:
+        """Calculate growth for a specific period using existing ticker.
+
+        A prefetched full history (e.g. TickerBundle.history_max) may be
+        passed to compute the growth from an in-memory slice instead of a
+        network call.
+        """
         try:
-            hist_start = ticker.history(period=period)
-            hist_end = ticker.history(period="1d")
-            
-            if hist_start.empty or hist_end.empty:
+            period_key = period.lower()
+
+            if history is not None:
+                if history.empty:
+                    return None
+                # Slice the prefetched bars in memory; a NumPy comparison
+                # replaces a whole history round trip per period.
+                cutoff = history.index[-1] - _PERIOD_SPAN.get(period_key, _PERIOD_SPAN["1y"])
+                hist = history.loc[history.index >= cutoff]
+            else:
+                # history() blocks on the network; run it in a worker
+                # thread. The last row of this fetch is already the latest
+                # close, so no separate period="1d" round trip is needed.
+                hist = await asyncio.to_thread(ticker.history, period=period)
+
+            if hist.empty:
                 return None
-            
-            # Check if we have sufficient data for the requested period
-            actual_start_date = hist_start.index[0]
-            current_date = datetime.now().replace(tzinfo=actual_start_date.tz)
-            
-            # Calculate required lookback period
-            required_years = self._period_to_years(period)
-            required_date = current_date - timedelta(days=required_years * 365 * 0.8)
-            
-            if actual_start_date > required_date:
+
+            # Check if we have sufficient data for the requested period,
+            # measured against the newest bar rather than a tz-mangled
+            # datetime.now()
+            required_date = hist.index[-1] - _REQUIRED_LOOKBACK.get(period_key, _REQUIRED_LOOKBACK["1y"])
+
+            if hist.index[0] > required_date:
                 # Not enough historical data
                 return None
-            
-            start_price = float(hist_start.iloc[0]['Close'])
-            end_price = float(hist_end.iloc[-1]['Close'])
-            
-            if start_price <= 0:
+
+            # Read straight from the ndarray; iloc would build a Series and
+            # do a label lookup per access
+            closes = hist['Close'].to_numpy()
+            start_price = float(closes[0])
+            end_price = float(closes[-1])
+
+            growth = _growth(start_price, end_price)
+            if growth != growth:
                 return None
-            
-            growth = ((end_price - start_price) / start_price) * 100
             return Decimal(str(growth))
             
         except Exception as e:
             logger.warning(f"Failed to calculate {period} growth: {e}")
             return None
-    
-    def _period_to_years(self, period: str) -> int:
-        """Convert period string to years."""
-        period_map = {
-            "1y": 1,
-            "2y": 2,
-            "5y": 5,
-            "10y": 10
-        }
-        return period_map.get(period.lower(), 1)
\ No newline at end of file
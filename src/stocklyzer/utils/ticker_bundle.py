@@ -0,0 +1,46 @@
+"""Prefetched per-ticker data shared across analysis services."""
+
+import yfinance as yf
+import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+
+@dataclass(slots=True)
+class TickerBundle:
+    """Everything the composite analysis path needs for one ticker.
+
+    Fetched once, concurrently, then shared: DiscountedCashFlow reads the
+    fundamentals from here instead of re-fetching them, and GrowthCalculator
+    slices history_max in memory instead of issuing one history call per
+    period.
+    """
+
+    info: dict
+    balance_sheet: pd.DataFrame
+    financials: pd.DataFrame
+    cash_flow: pd.DataFrame
+    history_max: pd.DataFrame
+
+    @classmethod
+    def fetch(cls, ticker) -> 'TickerBundle':
+        """Fetch all fields concurrently for a symbol or yf.Ticker.
+
+        The five fetches are independent HTTP calls, so wall time is the
+        slowest round trip rather than the sum of all five.
+        """
+        if not isinstance(ticker, yf.Ticker):
+            ticker = yf.Ticker(ticker)
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            info_future = executor.submit(lambda: ticker.info)
+            bs_future = executor.submit(lambda: ticker.balance_sheet)
+            fin_future = executor.submit(lambda: ticker.financials)
+            cf_future = executor.submit(lambda: ticker.cash_flow)
+            hist_future = executor.submit(ticker.history, period="max")
+        return cls(
+            info=info_future.result(),
+            balance_sheet=bs_future.result(),
+            financials=fin_future.result(),
+            cash_flow=cf_future.result(),
+            history_max=hist_future.result(),
+        )
@@ -1,23 +1,27 @@
 """Input validation utilities."""
 
+import re
+from typing import Iterable, List
+
+# Compiled once at import: 1-5 letters, leading/trailing whitespace tolerated.
+# A single regex scan replaces the separate strip/len/isalpha checks.
+_SYMBOL_PATTERN = re.compile(r'\s*[A-Za-z]{1,5}\s*\Z')
+
 
 class SymbolValidator:
     """Validates stock symbols."""
-    
-    def is_valid_symbol(self, symbol: str) -> bool:
-        """Validate stock symbol format."""
-        if not isinstance(symbol, str):
-            return False
-        
-        # Basic validation rules
-        symbol = symbol.strip().upper()
-        
-        # Length check (1-5 characters for most markets)
-        if not (1 <= len(symbol) <= 5):
-            return False
-        
-        # Only letters allowed
-        if not symbol.isalpha():
-            return False
-        
-        return True
\ No newline at end of file
+
+    # Stateless; no per-instance __dict__ needed.
+    __slots__ = ()
+
+    @staticmethod
+    def is_valid_symbol(symbol: str) -> bool:
+        """Validate stock symbol format (1-5 letters for most markets)."""
+        return isinstance(symbol, str) and _SYMBOL_PATTERN.match(symbol) is not None
+
+    @staticmethod
+    def is_valid_symbols(symbols: Iterable[str]) -> List[bool]:
+        """Validate many symbols in one tight loop over the bound matcher."""
+        match = _SYMBOL_PATTERN.match
+        return [isinstance(symbol, str) and match(symbol) is not None
+                for symbol in symbols]
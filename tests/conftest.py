@@ -0,0 +1,44 @@
+"""Shared fixtures for the test suite.
+
+Session-scoped fixtures here hold only cheap, self-contained objects, so
+they rebuild safely per worker if the suite is ever run under
+pytest-xdist (--dist=loadfile / loadscope).
+"""
+
+from decimal import Decimal
+
+import pytest
+
+from stocklyzer.domain.models import GrowthMetrics
+
+
+@pytest.fixture(scope="session")
+def growth():
+    """One read-only GrowthMetrics shared across the whole run.
+
+    The domain dataclasses are treated as immutable by the tests, so a
+    single instance serves every case.
+    """
+    return GrowthMetrics(
+        one_year=Decimal("-7.52"),
+        two_years=Decimal("6.14"),
+        three_years=Decimal("25.48"),
+        five_years=Decimal("91.11"),
+        ten_years=Decimal("662.93")
+    )
+
+
+@pytest.fixture(scope="session")
+def aapl_ticker():
+    """One AAPL ticker shared by every live-data test in the session."""
+    # Deferred import: only the slow-marked tests use these fixtures, so
+    # default runs skip the yfinance import entirely.
+    import yfinance as yf
+    return yf.Ticker("AAPL")
+
+
+@pytest.fixture(scope="session")
+def multi_tickers():
+    """One shared multi-symbol session for batch-style tests."""
+    import yfinance as yf
+    return yf.Tickers("AAPL GOOG MSFT")
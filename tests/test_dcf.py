@@ -0,0 +1,48 @@
+"""Tests for the discounted cash flow service.
+
+Imports of the service (and transitively yfinance/pandas) happen inside
+the test bodies so default collection stays cheap.
+"""
+
+from decimal import Decimal
+
+import pytest
+
+
+def test_wacc_missing_market_cap_returns_none(monkeypatch):
+    """A bundle without a market cap short-circuits to None, no network."""
+    import pandas as pd
+    from stocklyzer.services import dcf
+    from stocklyzer.utils import TickerBundle
+
+    # The calculation always submits the treasury fetch; stub it so the
+    # test issues no HTTP call and leaves the day-keyed cache untouched.
+    dcf.clear_treasury_cache()
+    monkeypatch.setattr(dcf, "_cached_treasury_rate", lambda day: 0.04)
+
+    empty = pd.DataFrame()
+    bundle = TickerBundle(info={}, balance_sheet=empty, financials=empty,
+                          cash_flow=empty, history_max=empty)
+    service = dcf.DiscountedCashFlow("AAPL", bundle=bundle)
+    assert service.calculate_weighted_average_cost_of_capital() is None
+
+
+@pytest.mark.slow
+def test_wacc_calculation_real_aapl_data(aapl_ticker):
+    """WACC for AAPL lands in a plausible range (live network)."""
+    from stocklyzer.services.dcf import DiscountedCashFlow
+
+    dcf = DiscountedCashFlow(aapl_ticker)
+    wacc = dcf.calculate_weighted_average_cost_of_capital()
+    assert wacc is not None
+    assert Decimal('0') < wacc < Decimal('1')
+
+
+@pytest.mark.slow
+def test_wacc_calculation_real_data_multiple_stocks(multi_tickers):
+    """WACC across several tickers reuses the shared session (live network)."""
+    from stocklyzer.services.dcf import DiscountedCashFlow
+
+    for ticker in multi_tickers.tickers.values():
+        wacc = DiscountedCashFlow(ticker).calculate_weighted_average_cost_of_capital()
+        assert wacc is None or Decimal('0') < wacc < Decimal('1')